@@ -7,18 +7,224 @@ https://en.wikipedia.org/wiki/Adjacency_list
 
 Assume that we have V vertices and E edges in the graph G.
 """
+from collections import OrderedDict
 from collections import defaultdict
 from collections import deque
+import functools
 import heapq
+import math
+
+
+# A sentinel for next(), since a vertex could be any hashable value, including None.
+_EXHAUSTED = object()
+
+
+# O(E * log V)
+def _dijkstra_csr(indptr, indices, weights, start, end=-1, heuristic=None):
+    """
+    Dijkstra's algorithm on a graph in CSR form, in which vertices are dense integer ids.
+    Returns (distances, backtracks), and backtracks[v] is -1 if v has no predecessor.
+
+    If end is given, we stop as soon as its distance is final.
+    If heuristic(v) is also given, it's A* search, which prioritizes vertices by distances[v] + heuristic(v).
+    """
+    vertex_count = len(indptr) - 1
+    distances = [float('inf')] * vertex_count
+    backtracks = [-1] * vertex_count
+    distances[start] = 0
+
+    # A vertex could be pushed to the priority queue multiple times,
+    # so we skip stale entries of a vertex once it's finalized (popped with its shortest distance).
+    # NOTE: heapq with lazy deletion is faster than a pure-Python heap with decrease-key,
+    # since heapq pushes and pops in C.
+    finalized = bytearray(vertex_count)
+
+    # We hold back the last vertex pushed while relaxing edges of a vertex,
+    # and push it together with the next pop by heapq.heappushpop(),
+    # which doesn't touch the queue at all if it's already the minimum.
+    min_heap = []  # (priority, vertex id)
+    pending = (heuristic(start) if heuristic else 0, start)
+    while pending or min_heap:
+        if pending:
+            _, src = heapq.heappushpop(min_heap, pending)
+            pending = None
+        else:
+            _, src = heapq.heappop(min_heap)
+        if finalized[src]:
+            continue
+        finalized[src] = 1
+        if src == end:
+            break
+
+        src_distance = distances[src]
+        for i in range(indptr[src], indptr[src + 1]):
+            des = indices[i]
+            # Without a heuristic, a finalized vertex stays final,
+            # so a negative weight cycle couldn't shorten distances forever.
+            if finalized[des] and heuristic is None:
+                continue
+            distance_to_des = src_distance + weights[i]
+            if distance_to_des < distances[des]:
+                distances[des] = distance_to_des
+                backtracks[des] = src
+                # With an inconsistent heuristic, a finalized vertex could be pushed again (reopened).
+                finalized[des] = 0
+                if pending:
+                    heapq.heappush(min_heap, pending)
+                pending = (distance_to_des + heuristic(des) if heuristic else distance_to_des, des)
+
+    return (distances, backtracks)
+
+
+# O(V * E), but it stops as soon as distances converge
+def _bellman_ford_csr(indptr, sources, indices, weights, start, relax=None):
+    """
+    Bellman-Ford algorithm on a graph in CSR form, in which vertices are dense integer ids.
+    Returns (distances, backtracks), and backtracks[v] is -1 if v has no predecessor.
+
+    We iterate the edge list of parallel arrays (sources, indices, weights) instead of rows of CSR,
+    so that each pass is a single flat loop over all edges.
+    If relax is given, which is generated by _compile_relax() for the same edges, each pass calls it instead.
+    """
+    vertex_count = len(indptr) - 1
+    distances = [float('inf')] * vertex_count
+    backtracks = [-1] * vertex_count
+    distances[start] = 0
+
+    # We have to do at most (V - 1) * E times to readjust distances.
+    # The first loop, it calculates the shortest paths with at most 1 edge.
+    # Then, it calculates the shortest paths with at most 2 edges, and so on.
+    for _ in range(vertex_count - 1):
+        if relax:
+            relaxed = relax(distances, backtracks)
+        else:
+            relaxed = False
+            for src, des, weight in zip(sources, indices, weights):
+                distance_to_des = distances[src] + weight  # The distance to destination.
+                if distance_to_des < distances[des]:
+                    distances[des] = distance_to_des
+                    backtracks[des] = src
+                    relaxed = True
+
+        # Distances have converged, so there's no negative weight cycle reachable from start.
+        if not relaxed:
+            return (distances, backtracks)
+
+    # Since a shortest path has at most V - 1 edges,
+    # if we could still shorten any distance, there are negative weight cycles.
+    if relax:
+        if relax(distances, backtracks):
+            raise ValueError('Found negative weight cycles')
+    else:
+        for src, des, weight in zip(sources, indices, weights):
+            if distances[src] + weight < distances[des]:
+                raise ValueError('Found negative weight cycles')
+
+    return (distances, backtracks)
+
+
+def _compile_relax(sources, indices, weights):
+    """
+    Generate a function relax(distances, backtracks), which relaxes all edges once
+    and returns whether any distance is shortened, for example:
+
+    def relax(distances, backtracks):
+        relaxed = False
+        distance_to_des = distances[0] + 4
+        if distance_to_des < distances[1]:
+            distances[1] = distance_to_des
+            backtracks[1] = 0
+            relaxed = True
+        ...
+        return relaxed
+
+    Vertex ids and weights are inlined as constants, so a pass has no loop and no tuple unpacking.
+    A generated pass is about 2.5 times faster than a plain one, but compiling costs as much as
+    hundreds of plain passes, so it only pays off if the same edges are relaxed many times.
+    https://en.wikipedia.org/wiki/Partial_evaluation
+    """
+    lines = [
+        'def relax(distances, backtracks):',
+        '    relaxed = False',
+    ]
+    for i, (src, des, weight) in enumerate(zip(sources, indices, weights)):
+        # Only ints and finite floats could be written as literals, otherwise we look them up.
+        if type(weight) is int or (type(weight) is float and math.isfinite(weight)):
+            weight_code = repr(weight)
+        else:
+            weight_code = f'weights[{i}]'
+        lines.extend([
+            f'    distance_to_des = distances[{src}] + {weight_code}',
+            f'    if distance_to_des < distances[{des}]:',
+            f'        distances[{des}] = distance_to_des',
+            f'        backtracks[{des}] = {src}',
+            '        relaxed = True',
+        ])
+    lines.append('    return relaxed')
+
+    namespace = {'weights': weights}
+    exec(compile('\n'.join(lines), '<bellman_ford_relax>', 'exec'), namespace)
+    return namespace['relax']
+
+
+# The maximum number of shortest paths cached for a graph.
+PATH_CACHE_MAXSIZE = 1024
+# The maximum number of single-source shortest paths cached for a graph, each of which takes O(V) space.
+SSSP_CACHE_MAXSIZE = 16
+
+
+def _cache_path(find_path):
+    """
+    Memoize shortest paths found by find_path(self, start, end) for the current version of the graph.
+    The cache is dropped lazily on the first lookup after the graph is mutated,
+    and it keeps at most PATH_CACHE_MAXSIZE paths, in which the least recently used one is evicted first.
+    https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
+
+    We don't cache a search with extra arguments, e.g., a heuristic,
+    since a new function object is usually passed on every call, which would never be hit.
+    """
+    @functools.wraps(find_path)
+    def wrapper(self, start, end, *args, **kwargs):
+        if any(arg is not None for arg in args) or any(arg is not None for arg in kwargs.values()):
+            return find_path(self, start, end, *args, **kwargs)
+
+        self._drop_stale_caches()
+        key = (find_path.__name__, start, end)
+        try:
+            path = self._path_cache[key]
+            self._path_cache.move_to_end(key)
+        except KeyError:
+            path = tuple(find_path(self, start, end))
+            self._path_cache[key] = path
+            if len(self._path_cache) > PATH_CACHE_MAXSIZE:
+                self._path_cache.popitem(last=False)
 
+        # Return a new list, so the caller couldn't modify the cached path.
+        return list(path)
 
-class NestedBreak(Exception):
-    pass
+    return wrapper
 
 
 # This implementation cannot properly handle multiple edges between the same endpoints.
 # For instance, (u, v, 1), (u, v, 2) and (u, v, 3).
 class DirectedGraph:
+    # Attributes of a graph are fixed, so we don't need a __dict__ for each instance.
+    __slots__ = (
+        'outgoing_edges',
+        'incoming_edges',
+        'vertex_data',
+        '_vid',
+        '_vlabel',
+        '_edge_count',
+        '_version',
+        '_csr',
+        '_edges_cache',
+        '_bellman_ford_relax',
+        '_cache_version',
+        '_path_cache',
+        '_sssp_cache',
+    )
+
     def __init__(self):
         # {
         #     'source_vertex': {
@@ -27,56 +233,140 @@ class DirectedGraph:
         # }
         self.outgoing_edges = defaultdict(dict)
 
+        # A reverse index of outgoing_edges, so we don't have to scan the whole graph for incoming edges.
+        # {
+        #     'destination_vertex': {
+        #         'source_vertex': edge_weight,
+        #     },
+        # }
+        self.incoming_edges = defaultdict(dict)
+
         # {
         #     'vertex': data,
         # }
         self.vertex_data = {}
 
+        # Each vertex is interned as a dense integer id when it's added, which is used by CSR snapshots.
+        # When a vertex is removed, the last vertex takes over its id, so ids are always 0 to V - 1.
+        self._vid = {}  # {vertex: id}
+        self._vlabel = []  # [vertex, ]
+
+        # We keep track of the number of edges, so edge_count() doesn't have to iterate all edges.
+        self._edge_count = 0
+
+        # Every mutation bumps the version, so results cached for older versions are stale.
+        self._version = 0
+
+        # A compressed snapshot of the graph built by _to_csr(), it's reset on every mutation.
+        self._csr = None
+        # A tuple of all edges built by edges_list(), it's reset on every mutation.
+        self._edges_cache = None
+        # The relax function generated by compile_bellman_ford() for the current version of the graph.
+        self._bellman_ford_relax = None
+
+        # Results of the current version of the graph, which are dropped by _drop_stale_caches().
+        self._cache_version = 0
+        # Shortest paths, see _cache_path().
+        self._path_cache = OrderedDict()  # {(algorithm, start, end): path}
+        # Single-source shortest paths, see _sssp_from().
+        self._sssp_cache = OrderedDict()  # {start vertex id: (distances, backtracks)}
+
+    def _invalidate(self):
+        self._version += 1
+        self._csr = None
+        self._edges_cache = None
+        self._bellman_ford_relax = None
+
+    def _drop_stale_caches(self):
+        if self._cache_version != self._version:
+            self._path_cache.clear()
+            self._sssp_cache.clear()
+            self._cache_version = self._version
+
+    def _intern(self, v):
+        if v not in self._vid:
+            self._vid[v] = len(self._vlabel)
+            self._vlabel.append(v)
+
     def add_vertex(self, v, value=None):
         self.vertex_data[v] = value
+        self._intern(v)
+        self._invalidate()
 
     def add_edge(self, u, v, weight=None):
         # Make sure that both vertices are in the graph.
         self.vertex_data.setdefault(u)
         self.vertex_data.setdefault(v)
+        self._intern(u)
+        self._intern(v)
+        if v not in self.outgoing_edges[u]:
+            self._edge_count += 1
         self.outgoing_edges[u][v] = weight
+        self.incoming_edges[v][u] = weight
+        self._invalidate()
 
+    # O(deg(v))
     def remove_vertex(self, v):
         # Remove associate edges.
-        del self.outgoing_edges[v]
-        for _, incident_vertices in self.outgoing_edges.items():
-            # NOTE: We use list(dict.keys()) to avoid
-            # RuntimeError: dictionary changed size during iteration.
-            for destination in list(incident_vertices.keys()):
-                if destination == v:
-                    del incident_vertices[destination]
+        # A self-loop (v, v) is dropped along with the whole entry of v.
+        removed_edge_count = 0
+        for source in self.incoming_edges.pop(v, {}):
+            if source != v:
+                del self.outgoing_edges[source][v]
+            removed_edge_count += 1
+        for destination in self.outgoing_edges.pop(v, {}):
+            if destination != v:
+                del self.incoming_edges[destination][v]
+                removed_edge_count += 1
+        self._edge_count -= removed_edge_count
 
         # Remove associate data.
         del self.vertex_data[v]
+        vid = self._vid.pop(v)
+        last_vertex = self._vlabel.pop()
+        if vid < len(self._vlabel):
+            self._vlabel[vid] = last_vertex
+            self._vid[last_vertex] = vid
+        self._invalidate()
 
     def remove_edge(self, u, v):
         try:
             del self.outgoing_edges[u][v]
         except KeyError:
             raise ValueError(f'No such edge: {(u, v)}')
+        del self.incoming_edges[v][u]
+        self._edge_count -= 1
+        self._invalidate()
 
+    # O(1)
     def vertex_count(self):
-        return len(self.vertex_data.keys())
+        return len(self.vertex_data)
 
+    # O(1)
     def edge_count(self):
-        count = 0
-        for _ in self.edges():
-            count += 1
-        return count
+        return self._edge_count
 
     def vertices(self):
         for vertex in self.vertex_data.keys():
             yield vertex
 
     def edges(self):
-        for source, incident_edges in self.outgoing_edges.items():
-            for destination, weight in incident_edges.items():
-                yield (source, destination, weight)
+        yield from self.edges_list()
+
+    def edges_list(self):
+        """
+        Returns a tuple of all edges, which is built once for each version of the graph.
+        Iterating a tuple is much cheaper than resuming a generator for each edge.
+        """
+        if self._edges_cache is None:
+            _, labels, _, sources, indices, weights = self._to_csr()
+            self._edges_cache = tuple(zip(
+                map(labels.__getitem__, sources),
+                map(labels.__getitem__, indices),
+                weights,
+            ))
+
+        return self._edges_cache
 
     def incident_edges(self, v, edge_type='outgoing'):
         if edge_type == 'outgoing':
@@ -86,10 +376,15 @@ class DirectedGraph:
             except KeyError:
                 return []
         elif edge_type == 'incoming':
-            for source, incident_vertices in self.outgoing_edges.items():
-                for destination, weight in incident_vertices.items():
-                    if destination == v:
-                        yield (source, v, weight)
+            for source, weight in self.incoming_edges.get(v, {}).items():
+                yield (source, v, weight)
+
+    def incident_edges_list(self, v, edge_type='outgoing'):
+        if edge_type == 'outgoing':
+            return tuple((v, destination, weight) for destination, weight in self.outgoing_edges.get(v, {}).items())
+        elif edge_type == 'incoming':
+            return tuple((source, v, weight) for source, weight in self.incoming_edges.get(v, {}).items())
+        return ()
 
     def edge_weight(self, u, v):
         try:
@@ -103,18 +398,19 @@ class DirectedGraph:
         https://en.wikipedia.org/wiki/Breadth-first_search
         https://cp-algorithms.com/graph/breadth-first-search.html#toc-tgt-2
         """
+        outgoing_edges = self.outgoing_edges
         visited = set()
-        current_level = [v, ]
+        current_level = {v, }
         while current_level:
-            next_level = []
-            for node in current_level:
-                # NOTE: A vertex is visited means we can access its adjacent vertices (neighbors).
-                visited.add(node)
-                for neighbor in self.outgoing_edges[node].keys():
-                    if neighbor not in visited:
-                        next_level.append(neighbor)
-
-            current_level = next_level
+            # NOTE: A vertex is visited means we can access its adjacent vertices (neighbors).
+            visited |= current_level
+            # A set deduplicates vertices which are reachable from multiple vertices in the same level.
+            current_level = {
+                neighbor
+                for node in current_level
+                for neighbor in outgoing_edges[node]
+                if neighbor not in visited
+            }
 
         return visited
 
@@ -131,14 +427,23 @@ class DirectedGraph:
         return visited
 
     def depth_first_search(self, v, visited=None):
+        """
+        We use an explicit stack instead of recursion to avoid RecursionError on a deep graph.
+        The stack holds an iterator of neighbors for each vertex on the current path,
+        so we resume where we left off and visit vertices in the same order as the recursive version.
+        """
         if visited is None:
             visited = set()
 
         visited.add(v)
-        for neighbor in self.outgoing_edges[v].keys():
-            if neighbor not in visited:
-                # Recursion uses the call "stack".
-                self.depth_first_search(neighbor, visited)
+        stack = [iter(self.outgoing_edges[v]), ]
+        while stack:
+            neighbor = next(stack[-1], _EXHAUSTED)
+            if neighbor is _EXHAUSTED:
+                stack.pop()
+            elif neighbor not in visited:
+                visited.add(neighbor)
+                stack.append(iter(self.outgoing_edges[neighbor]))
 
         return visited
 
@@ -147,6 +452,9 @@ class DirectedGraph:
         stack = [v, ]
         while stack:
             node = stack.pop()
+            # A vertex could be pushed multiple times before it's popped, so we skip it if it's already visited.
+            if node in visited:
+                continue
             visited.add(node)
             for neighbor in self.outgoing_edges[node].keys():
                 if neighbor not in visited:
@@ -154,103 +462,198 @@ class DirectedGraph:
 
         return visited
 
-    def construct_path(self, backtracks, start, end):
-        backtrack_path = [end, ]
-        last_step = backtracks.get(end)
-        while last_step:
-            backtrack_path.append(last_step)
-            last_step = backtracks[last_step]
+    def _to_csr(self):
+        """
+        Compress the graph into Compressed Sparse Row (CSR) arrays with dense integer vertex ids:
+        - labels[i] is the vertex whose id is i, and ids[labels[i]] is i, see _intern().
+        - indices[indptr[i]:indptr[i + 1]] are ids of destination vertices of outgoing edges of vertex i.
+        - weights[indptr[i]:indptr[i + 1]] are weights of those edges.
+        - sources[j] is the id of the source vertex of the edge j, so it's also an edge list with indices and weights.
+
+        Traversing flat lists by integer positions avoids hashing vertices on every edge.
+        https://en.wikipedia.org/wiki/Sparse_matrix#Compressed_sparse_row_(CSR,_CRS_or_Yale_format)
+
+        NOTE: The snapshot isn't updated incrementally, any mutation drops it,
+        and the next search rebuilds it from scratch in O(V + E).
+        So it pays off when the graph is searched many times between mutations,
+        but if mutations and searches are interleaved, every search pays for a full rebuild.
+        """
+        if self._csr is None:
+            ids = self._vid
+            labels = self._vlabel
+            indptr = [0, ]
+            sources = []
+            indices = []
+            weights = []
+            for i, v in enumerate(labels):
+                for destination, weight in self.outgoing_edges.get(v, {}).items():
+                    sources.append(i)
+                    indices.append(ids[destination])
+                    weights.append(weight)
+                indptr.append(len(indices))
+            self._csr = (ids, labels, indptr, sources, indices, weights)
+
+        return self._csr
 
-        if backtrack_path[-1] != start:
+    def construct_path(self, backtracks, start, end):
+        # We walk backward from end until we reach start, so we prepend each step to build the path in order.
+        # NOTE: It doesn't matter what backtracks[start] is, so it could be None or start itself,
+        # and a vertex could be any hashable value, including 0 and None.
+        path = deque([end, ])
+        step = end
+        while step != start:
+            if step not in backtracks:
+                raise ValueError(f'No path from {start} to {end}')
+            step = backtracks[step]
+            path.appendleft(step)
+
+        return list(path)
+
+    def _construct_path_from_ids(self, id_backtracks, start, end):
+        # The same as construct_path(), but backtracks is a list indexed by vertex ids,
+        # in which -1 means there's no predecessor, so we don't have to build a dict of all vertices.
+        labels = self._vlabel
+        path = deque()
+        step = self._vid[end]
+        while step != -1:
+            path.appendleft(labels[step])
+            step = id_backtracks[step]
+
+        if path[0] != start:
             raise ValueError(f'No path from {start} to {end}')
 
-        return list(reversed(backtrack_path))
+        return list(path)
 
-    # O(V + E)
+    # O(V + E), but it usually visits far fewer vertices than a single-source BFS
+    @_cache_path
     def find_shortest_path_bfs(self, start, end):
         """
         This algorithm can only work with a unweighted graph.
+
+        We search forward from start along outgoing edges and backward from end along incoming edges
+        at the same time, and always expand the smaller frontier by one level until two searches meet.
+        With a branching factor b and a distance d, it visits O(b ^ (d / 2)) vertices instead of O(b ^ d).
+        https://en.wikipedia.org/wiki/Bidirectional_search
         """
-        backtracks = {v: None for v in self.vertex_data.keys()}
-        visited = set([start, ])
-        queue = deque([start, ])
-        try:
-            while queue:
-                v = queue.popleft()
-                for neighbor in self.outgoing_edges[v].keys():
+        if start == end:
+            return self.construct_path({}, start, end)
+
+        # Index 0 is the forward search from start, and index 1 is the backward search from end.
+        # A vertex is visited if and only if it's in backtracks,
+        # and start (or end) is its own predecessor (or successor).
+        adjacent_edges = (self.outgoing_edges, self.incoming_edges)
+        backtracks = ({start: start}, {end: end})  # ({destination: source}, {source: destination})
+        frontiers = [[start, ], [end, ]]
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            visited = backtracks[side]
+            next_frontier = []
+            for v in frontiers[side]:
+                for neighbor in adjacent_edges[side][v].keys():
                     if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append(neighbor)
-                        backtracks[neighbor] = v
-                        if neighbor == end:
-                            raise NestedBreak
-        except NestedBreak:
-            pass
+                        visited[neighbor] = v
+                        next_frontier.append(neighbor)
+                        if neighbor in backtracks[1 - side]:
+                            # Two searches meet at neighbor, so we join start -> neighbor and neighbor -> end.
+                            forward_path = self.construct_path(backtracks[0], start, neighbor)
+                            backward_path = self.construct_path(backtracks[1], end, neighbor)
+                            return forward_path + backward_path[-2::-1]
+            frontiers[side] = next_frontier
 
-        return self.construct_path(backtracks, start, end)
+        raise ValueError(f'No path from {start} to {end}')
 
     # O(E * log V)
-    def find_shortest_path_dijkstra(self, start, end):
+    @_cache_path
+    def find_shortest_path_dijkstra(self, start, end, heuristic=None):
         """
         This algorithm can only work with a non-negative graph.
         https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
         https://leetcode.com/problems/network-delay-time/discuss/329376/efficient-oe-log-v-python-dijkstra-min-heap-with-explanation
+
+        If heuristic(v, end) is given, which estimates the distance from v to end, it becomes A* search.
+        The heuristic should be consistent, i.e., heuristic(u, end) <= weight(u, v) + heuristic(v, end),
+        so A* explores far fewer vertices than Dijkstra's algorithm and still finds the shortest path.
+        https://en.wikipedia.org/wiki/A*_search_algorithm
         """
-        # First, we overestimate the distance from start to all other vertices.
-        distances = {}  # The distance from start to a vertex v.
-        backtracks = {}  # {destination: source}
-        for v in self.vertex_data.keys():
-            distances[v] = float('inf')
-            backtracks[v] = None
-        distances[start] = 0
-
-        # We maintain a priority queue to extract a vertex v which has the minimum distance.
-        visited = set()
-        min_heap = [(0, start), ]  # (distance, vertex)
-        while min_heap:
-            src_distance, src = heapq.heappop(min_heap)
-            # A vertex could be added to the priority queue multiple times,
-            # so we need to track visited vertices.
-            visited.add(src)
-            for des, weight in self.outgoing_edges[src].items():
-                if des in visited:
-                    continue
-                distance_to_des = src_distance + weight
-                if distance_to_des < distances[des]:
-                    # We find a shorter path to des,
-                    # so distances of its dess should also be readjust.
-                    distances[des] = distance_to_des
-                    backtracks[des] = src
-                    heapq.heappush(min_heap, (distances[des], des))
+        ids, labels, indptr, _, indices, weights = self._to_csr()
+        if start not in ids or end not in ids:
+            # There's no path unless start and end are the same vertex.
+            return self.construct_path({}, start, end)
+
+        if heuristic is None:
+            # One run of Dijkstra's algorithm finds shortest paths from start to all vertices,
+            # so we reuse it for any end.
+            _, id_backtracks = self._sssp_from(ids[start])
+        else:
+            def estimate(v):
+                return heuristic(labels[v], end)
+
+            _, id_backtracks = _dijkstra_csr(indptr, indices, weights, ids[start], ids[end], estimate)
+
+        return self._construct_path_from_ids(id_backtracks, start, end)
+
+    def _sssp_from(self, start):
+        # Returns cached (distances, backtracks) from the vertex id start, indexed by vertex ids.
+        # Like _cache_path(), it keeps at most SSSP_CACHE_MAXSIZE sources and evicts the least recently used one.
+        self._drop_stale_caches()
+        try:
+            result = self._sssp_cache[start]
+            self._sssp_cache.move_to_end(start)
+        except KeyError:
+            _, _, indptr, _, indices, weights = self._to_csr()
+            result = _dijkstra_csr(indptr, indices, weights, start)
+            self._sssp_cache[start] = result
+            if len(self._sssp_cache) > SSSP_CACHE_MAXSIZE:
+                self._sssp_cache.popitem(last=False)
 
-        return self.construct_path(backtracks, start, end)
+        return result
+
+    # O(E * log V)
+    def single_source_shortest_paths(self, start):
+        """
+        Returns (distances, backtracks) of shortest paths from start to all reachable vertices,
+        in which distances is {vertex: distance} and backtracks is {destination: source}.
+        This algorithm can only work with a non-negative graph.
+        """
+        if start not in self._vid:
+            raise ValueError(f'No such vertex: {start}')
+
+        labels = self._vlabel
+        id_distances, id_backtracks = self._sssp_from(self._vid[start])
+        distances = {}
+        backtracks = {}
+        for v, distance in enumerate(id_distances):
+            if distance != float('inf'):
+                distances[labels[v]] = distance
+                backtracks[labels[v]] = labels[id_backtracks[v]] if id_backtracks[v] != -1 else None
+
+        return (distances, backtracks)
+
+    # O(E)
+    def compile_bellman_ford(self):
+        """
+        Generate code specialized to the current edges for find_shortest_path_bellman_ford(), see _compile_relax().
+        It's only worth calling before many searches that each take many passes, e.g., on a long chain of edges,
+        since compiling costs about as much as 500 plain passes. The code is dropped on the next mutation.
+        """
+        _, _, _, sources, indices, weights = self._to_csr()
+        self._bellman_ford_relax = _compile_relax(sources, indices, weights)
 
     # O(V * E)
+    @_cache_path
     def find_shortest_path_bellman_ford(self, start, end):
         """
         This algorithm can only work with a graph which has no negative weight cycles.
+        It uses the code generated by compile_bellman_ford() if any.
         https://en.wikipedia.org/wiki/Bellman%E2%80%93Ford_algorithm
         """
-        # First, we overestimate the distance from start to all other vertices.
-        distances = {}  # The distance from start to a vertex v.
-        backtracks = {}  # {destination: source}
-        for v in self.vertex_data.keys():
-            distances[v] = float('inf')
-            backtracks[v] = None
-        distances[start] = 0
-
-        # We have to do V * E times to readjust distances.
-        vertex_count = self.vertex_count()
-        # The first loop, it calculates the shortest paths with at most 1 edge.
-        # Then, it calculates the shortest paths with at most 2 edges, and so on.
-        for i in range(vertex_count):
-            for src, des, weight in self.edges():
-                distance_to_des = distances[src] + weight  # The distance to destination.
-                if distance_to_des < distances[des]:
-                    # The final loop is to check wheter there are negative weight cycles.
-                    if i == vertex_count - 1:
-                        raise ValueError('Found negative weight cycles')
-                    distances[des] = distance_to_des
-                    backtracks[des] = src
-
-        return self.construct_path(backtracks, start, end)
+        ids, _, indptr, sources, indices, weights = self._to_csr()
+        if start not in ids or end not in ids:
+            # There's no path unless start and end are the same vertex.
+            return self.construct_path({}, start, end)
+
+        _, id_backtracks = _bellman_ford_csr(
+            indptr, sources, indices, weights, ids[start],
+            relax=self._bellman_ford_relax,
+        )
+        return self._construct_path_from_ids(id_backtracks, start, end)
@@ -10,6 +10,8 @@ from data_structures.graphs.adjacency_map_directed_weighted_graph import Directe
 
 
 class UndirectedGraph(DirectedGraph):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -24,22 +26,30 @@ class UndirectedGraph(DirectedGraph):
         # NOTE: outgoing_edges of an undirected graph contains both (u, v) and (v, u) for each edge.
         self.outgoing_edges = defaultdict(dict)
 
+        # NOTE: Every edge is both outgoing and incoming, so the reverse index is the same map.
+        self.incoming_edges = self.outgoing_edges
+
     def add_edge(self, u, v, weight=None):
+        # Make sure that both vertices are in the graph.
+        self.vertex_data.setdefault(u)
+        self.vertex_data.setdefault(v)
+        self._intern(u)
+        self._intern(v)
+        if v not in self.outgoing_edges[u]:
+            self._edge_count += 1
         self.outgoing_edges[u][v] = weight
         self.outgoing_edges[v][u] = weight
+        self._invalidate()
 
     def remove_edge(self, u, v):
         try:
             del self.outgoing_edges[u][v]
-            del self.outgoing_edges[v][u]
         except KeyError:
             raise ValueError(f'No such edge: {(u, v)} or {(v, u)}')
-
-    def edge_count(self):
-        count = 0
-        for _ in self.edges():
-            count += 1
-        return count
+        # NOTE: (v, u) is already gone if it's a self-loop.
+        self.outgoing_edges[v].pop(u, None)
+        self._edge_count -= 1
+        self._invalidate()
 
     def edges(self):
         deduplicate_edges = set()
@@ -51,6 +61,12 @@ class UndirectedGraph(DirectedGraph):
 
         return deduplicate_edges
 
+    def edges_list(self):
+        if self._edges_cache is None:
+            self._edges_cache = tuple(self.edges())
+
+        return self._edges_cache
+
     def incident_edges(self, v, edge_type='outgoing'):
         try:
             for destination, weight in self.outgoing_edges[v].items():
@@ -58,3 +74,6 @@ class UndirectedGraph(DirectedGraph):
                 yield (pair[0], pair[1], weight)
         except KeyError:
             return []
+
+    def incident_edges_list(self, v, edge_type='outgoing'):
+        return tuple(self.incident_edges(v, edge_type))
@@ -0,0 +1,34 @@
+# coding: utf-8
+import pytest
+
+from data_structures.graphs.adjacency_map_directed_weighted_graph import DirectedGraph
+
+
+# A chain 0 -> 1 -> ... -> n - 1, whose vertices are added backwards,
+# so each pass of Bellman-Ford relaxes only one more edge of the chain.
+n = 300
+starts = range(10)
+expected = [list(range(start, n)) for start in starts]
+
+
+def search_chain(compile_bellman_ford):
+    graph = DirectedGraph()
+    for v in reversed(range(n)):
+        graph.add_vertex(v)
+    for v in range(n - 1):
+        graph.add_edge(v, v + 1, 1)
+
+    if compile_bellman_ford:
+        graph.compile_bellman_ford()
+
+    return [graph.find_shortest_path_bellman_ford(start, n - 1) for start in starts]
+
+
+@pytest.mark.benchmark(group='bellman_ford', disable_gc=True, warmup=False)
+def test_benchmark_bellman_ford(benchmark):
+    assert benchmark(search_chain, False) == expected
+
+
+@pytest.mark.benchmark(group='bellman_ford', disable_gc=True, warmup=False)
+def test_benchmark_bellman_ford_compiled(benchmark):
+    assert benchmark(search_chain, True) == expected
@@ -1,6 +1,10 @@
 # coding: utf-8
+from fractions import Fraction
+import sys
 import unittest
+from unittest import mock
 
+from data_structures.graphs import adjacency_map_directed_weighted_graph as graph_module
 from data_structures.graphs.adjacency_map_directed_weighted_graph import DirectedGraph
 
 
@@ -51,10 +55,18 @@ class TestCase(unittest.TestCase):
             if not source == 'C' and not destination == 'C':
                 edge_count += 1
         self.assertEqual(self.graph.edge_count(), edge_count)
+        self.assertCountEqual(self.graph.incident_edges('D', edge_type='incoming'), [('B', 'D', 1), ])
+        self.assertCountEqual(self.graph.incident_edges('D', edge_type='outgoing'), [('D', 'H', 1), ])
+
+        # A vertex without outgoing edges.
+        self.graph.remove_vertex('I')
+        self.assertEqual(self.graph.vertex_count(), len(self.vertices) - 2)
+        self.assertCountEqual(self.graph.incident_edges('H', edge_type='outgoing'), [])
 
     def test_remove_edge(self):
         self.graph.remove_edge('A', 'B')
         self.assertEqual(self.graph.edge_count(), len(self.edges) - 1)
+        self.assertCountEqual(self.graph.incident_edges('B', edge_type='incoming'), [])
 
         with self.assertRaises(ValueError):
             self.graph.remove_edge('Z', 'Z')
@@ -65,12 +77,29 @@ class TestCase(unittest.TestCase):
     def test_edge_count(self):
         self.assertEqual(self.graph.edge_count(), len(self.edges))
 
+        # Overwriting the weight of an existing edge doesn't add a new edge.
+        self.graph.add_edge('A', 'B', 2)
+        self.assertEqual(self.graph.edge_count(), len(self.edges))
+
+        # A self-loop is removed along with its vertex.
+        self.graph.add_edge('A', 'A', 1)
+        self.assertEqual(self.graph.edge_count(), len(self.edges) + 1)
+        self.graph.remove_vertex('A')
+        self.assertEqual(self.graph.edge_count(), len(list(self.graph.edges())))
+
     def test_vertices(self):
         self.assertCountEqual(self.graph.vertices(), self.vertices)
 
     def test_edges(self):
         self.assertCountEqual(self.graph.edges(), self.edges)
 
+    def test_edges_list(self):
+        self.assertCountEqual(self.graph.edges_list(), self.edges)
+        self.assertIs(self.graph.edges_list(), self.graph.edges_list())
+
+        self.graph.remove_edge('A', 'B')
+        self.assertCountEqual(self.graph.edges_list(), [edge for edge in self.edges if edge[:2] != ('A', 'B')])
+
     def test_incident_edges(self):
         vertex = 'A'
         outgoing_edges = [edge for edge in self.edges if edge[0] == vertex]
@@ -81,6 +110,17 @@ class TestCase(unittest.TestCase):
         self.assertCountEqual(self.graph.incident_edges('NOT EXIST', edge_type='outgoing'), [])
         self.assertCountEqual(self.graph.incident_edges('NOT EXIST', edge_type='incoming'), [])
 
+    def test_incident_edges_list(self):
+        vertex = 'B'
+        outgoing_edges = [edge for edge in self.edges if edge[0] == vertex]
+        self.assertCountEqual(self.graph.incident_edges_list(vertex, edge_type='outgoing'), outgoing_edges)
+        incoming_edges = [edge for edge in self.edges if edge[1] == vertex]
+        self.assertCountEqual(self.graph.incident_edges_list(vertex, edge_type='incoming'), incoming_edges)
+
+        self.assertEqual(self.graph.incident_edges_list('NOT EXIST', edge_type='outgoing'), ())
+        self.assertEqual(self.graph.incident_edges_list('NOT EXIST', edge_type='incoming'), ())
+        self.assertEqual(self.graph.incident_edges_list(vertex, edge_type='NOT EXIST'), ())
+
     def test_edge_weight(self):
         for source, destination, weight in self.edges:
             self.assertEqual(self.graph.edge_weight(source, destination), weight)
@@ -97,6 +137,14 @@ class TestCase(unittest.TestCase):
         visited = self.graph.depth_first_search(v)
         self.assertCountEqual(visited, ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I'])
 
+        # A graph which is deeper than the recursion limit.
+        graph = DirectedGraph()
+        depth = sys.getrecursionlimit() + 1
+        for i in range(depth):
+            graph.add_edge(i, i + 1)
+        visited = graph.depth_first_search(0)
+        self.assertEqual(len(visited), depth + 1)
+
     def test_breadth_first_search(self):
         v = 'A'
         visited = self.graph.breadth_first_search(v)
@@ -127,6 +175,49 @@ class TestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             graph.find_shortest_path_bfs('A', 'G')
 
+        path = graph.find_shortest_path_bfs('A', 'A')
+        self.assertEqual(path, ['A', ])
+
+        path = graph.find_shortest_path_bfs('A', 'F')
+        self.assertEqual(path, ['A', 'B', 'E', 'F'])
+
+        path = graph.find_shortest_path_bfs('G', 'F')
+        self.assertEqual(path, ['G', 'D', 'E', 'F'])
+
+        path = graph.find_shortest_path_bfs('B', 'C')
+        self.assertEqual(path, ['B', 'C'])
+
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_bfs('F', 'A')
+
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_bfs('A', 'NOT EXIST')
+
+        # Vertices could be any hashable value, including None.
+        graph.add_edge('F', None, 1)
+        graph.add_edge(None, 'G', 1)
+        path = graph.find_shortest_path_bfs('E', 'D')
+        self.assertEqual(path, ['E', 'F', None, 'G', 'D'])
+
+    def test_construct_path(self):
+        backtracks = {'A': None, 'B': 'A', 'C': 'B', 'D': None}
+        self.assertEqual(self.graph.construct_path(backtracks, 'A', 'C'), ['A', 'B', 'C'])
+        self.assertEqual(self.graph.construct_path(backtracks, 'A', 'A'), ['A', ])
+
+        with self.assertRaises(ValueError):
+            self.graph.construct_path(backtracks, 'A', 'D')
+
+        with self.assertRaises(ValueError):
+            self.graph.construct_path(backtracks, 'A', 'NOT EXIST')
+
+        # Vertices could be falsy.
+        backtracks = {0: None, 1: 0, 2: 1}
+        self.assertEqual(self.graph.construct_path(backtracks, 0, 2), [0, 1, 2])
+
+        # start could be its own predecessor.
+        backtracks = {'A': 'A', 'B': 'A'}
+        self.assertEqual(self.graph.construct_path(backtracks, 'A', 'B'), ['A', 'B'])
+
     def test_find_shortest_path_dijkstra(self):
         graph = DirectedGraph()
         edges = [  # https://www.chegg.com/homework-help/questions-and-answers/8-4-14-10-2-figure-2-directed-graph-computing-shortest-path-3-dijkstra-s-algorithm-computi-q25960616#question-transcript
@@ -160,6 +251,125 @@ class TestCase(unittest.TestCase):
         path = graph.find_shortest_path_dijkstra('E', 'C')
         self.assertEqual(path, ['E', 'H', 'F', 'C'])
 
+        # The graph is mutated after the previous searches.
+        graph.add_edge('E', 'C', 1)
+        path = graph.find_shortest_path_dijkstra('E', 'C')
+        self.assertEqual(path, ['E', 'C'])
+
+        graph.remove_vertex('H')
+        path = graph.find_shortest_path_dijkstra('A', 'I')
+        self.assertEqual(path, ['A', 'B', 'D', 'E', 'G', 'I'])
+
+        graph.remove_vertex('I')
+        path = graph.find_shortest_path_dijkstra('A', 'G')
+        self.assertEqual(path, ['A', 'B', 'D', 'E', 'G'])
+
+        # A negative weight cycle doesn't make the search loop forever.
+        graph = DirectedGraph()
+        edges = [
+            ('A', 'B', 1),
+            ('B', 'C', -5),
+            ('C', 'B', 1),
+            ('C', 'D', 1),
+        ]
+        for src, des, weight in edges:
+            graph.add_edge(src, des, weight)
+
+        path = graph.find_shortest_path_dijkstra('A', 'D')
+        self.assertEqual(path, ['A', 'B', 'C', 'D'])
+
+    def test_find_shortest_path_cache(self):
+        path = self.graph.find_shortest_path_bfs('E', 'I')
+        self.assertEqual(path, ['E', 'A', 'B', 'I'])
+
+        # Modifying the returned path doesn't affect the cached one.
+        path.append('X')
+        self.assertEqual(self.graph.find_shortest_path_bfs('E', 'I'), ['E', 'A', 'B', 'I'])
+
+        # Each algorithm has its own cache.
+        self.graph.add_edge('E', 'H', 3)
+        self.assertEqual(self.graph.find_shortest_path_bfs('E', 'I'), ['E', 'H', 'I'])
+        self.assertEqual(self.graph.find_shortest_path_dijkstra('E', 'I'), ['E', 'A', 'B', 'I'])
+
+        # The cache is dropped once the graph is mutated.
+        self.graph.remove_edge('A', 'B')
+        self.assertEqual(self.graph.find_shortest_path_dijkstra('E', 'I'), ['E', 'H', 'I'])
+
+        # A search with a heuristic isn't cached.
+        for _ in range(3):
+            path = self.graph.find_shortest_path_dijkstra('E', 'I', heuristic=lambda v, end: 0)
+            self.assertEqual(path, ['E', 'H', 'I'])
+        self.assertEqual(len(self.graph._path_cache), 1)
+
+        # The least recently used path is evicted first.
+        with mock.patch.object(graph_module, 'PATH_CACHE_MAXSIZE', 2):
+            self.graph.find_shortest_path_bfs('A', 'I')
+            self.graph.find_shortest_path_dijkstra('E', 'I')
+            self.graph.find_shortest_path_bfs('A', 'C')
+            self.assertEqual(list(self.graph._path_cache), [
+                ('find_shortest_path_dijkstra', 'E', 'I'),
+                ('find_shortest_path_bfs', 'A', 'C'),
+            ])
+
+    def test_single_source_shortest_paths(self):
+        self.graph.add_edge('A', 'D', 3)
+        distances, backtracks = self.graph.single_source_shortest_paths('A')
+        self.assertEqual(distances, {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'H': 3, 'I': 2})
+        self.assertEqual(backtracks['A'], None)
+        self.assertEqual(backtracks['D'], 'B')
+        self.assertEqual(self.graph.construct_path(backtracks, 'A', 'H'), ['A', 'B', 'D', 'H'])
+
+        with self.assertRaises(ValueError):
+            self.graph.single_source_shortest_paths('NOT EXIST')
+
+        # The least recently used source is evicted first.
+        with mock.patch.object(graph_module, 'SSSP_CACHE_MAXSIZE', 2):
+            self.graph.single_source_shortest_paths('B')
+            self.graph.single_source_shortest_paths('A')
+            self.graph.single_source_shortest_paths('E')
+            vid = self.graph._vid
+            self.assertEqual(list(self.graph._sssp_cache), [vid['A'], vid['E']])
+
+            distances, _ = self.graph.single_source_shortest_paths('A')
+            self.assertEqual(distances, {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'H': 3, 'I': 2})
+            self.assertEqual(list(self.graph._sssp_cache), [vid['E'], vid['A']])
+
+    def test_find_shortest_path_dijkstra_with_heuristic(self):
+        # A 5 x 5 grid, in which we could move right or down, with a wall at (1, 1), (1, 2) and (1, 3).
+        graph = DirectedGraph()
+        walls = {(1, 1), (1, 2), (1, 3)}
+        for x in range(5):
+            for y in range(5):
+                if (x, y) in walls:
+                    continue
+                if x + 1 < 5 and (x + 1, y) not in walls:
+                    graph.add_edge((x, y), (x + 1, y), 1)
+                if y + 1 < 5 and (x, y + 1) not in walls:
+                    graph.add_edge((x, y), (x, y + 1), 1)
+
+        def manhattan_distance(v, end):
+            return abs(end[0] - v[0]) + abs(end[1] - v[1])
+
+        path = graph.find_shortest_path_dijkstra((0, 0), (4, 4), heuristic=manhattan_distance)
+        self.assertEqual(len(path), 9)
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (4, 4))
+        self.assertTrue(walls.isdisjoint(path))
+
+        path = graph.find_shortest_path_dijkstra((0, 1), (0, 4), heuristic=manhattan_distance)
+        self.assertEqual(path, [(0, 1), (0, 2), (0, 3), (0, 4)])
+
+        # There is no such path.
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_dijkstra((0, 1), (2, 2), heuristic=manhattan_distance)
+
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_dijkstra((4, 4), (0, 0), heuristic=manhattan_distance)
+
+        # A heuristic which always returns 0 makes A* the same as Dijkstra's algorithm.
+        path = graph.find_shortest_path_dijkstra((0, 0), (4, 4), heuristic=lambda v, end: 0)
+        self.assertEqual(path, graph.find_shortest_path_dijkstra((0, 0), (4, 4)))
+
     def test_find_shortest_path_bellman_ford(self):
         graph = DirectedGraph()
         edges = [  # https://www.programiz.com/dsa/bellman-ford-algorithm
@@ -214,6 +424,35 @@ class TestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             graph.find_shortest_path_bellman_ford('A', 'E')
 
+        graph.compile_bellman_ford()
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_bellman_ford('A', 'E')
+
+        # The generated code is dropped once the cycle is broken.
+        graph.remove_edge('C', 'D')
+        path = graph.find_shortest_path_bellman_ford('A', 'E')
+        self.assertEqual(path, ['A', 'B', 'D', 'E'])
+
+        # Weights which couldn't be written as literals.
+        graph = DirectedGraph()
+        edges = [
+            ('A', 'B', Fraction(1, 3)),
+            ('A', 'C', Fraction(1, 2)),
+            ('B', 'C', Fraction(1, 10)),
+            ('C', 'D', float('inf')),
+        ]
+        for src, des, weight in edges:
+            graph.add_edge(src, des, weight)
+
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_bellman_ford('A', 'D')
+
+        graph.compile_bellman_ford()
+        path = graph.find_shortest_path_bellman_ford('A', 'C')
+        self.assertEqual(path, ['A', 'B', 'C'])
+        with self.assertRaises(ValueError):
+            graph.find_shortest_path_bellman_ford('A', 'D')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -61,6 +61,15 @@ class TestCase(unittest.TestCase):
     def test_edge_count(self):
         self.assertEqual(self.graph.edge_count(), len(self.edges))
 
+        # Adding the same edge in reverse doesn't add a new edge.
+        self.graph.add_edge('B', 'A', 0)
+        self.assertEqual(self.graph.edge_count(), len(self.edges))
+
+        self.graph.add_edge('A', 'A', 0)
+        self.assertEqual(self.graph.edge_count(), len(self.edges) + 1)
+        self.graph.remove_vertex('A')
+        self.assertEqual(self.graph.edge_count(), len(self.graph.edges()))
+
     def test_vertices(self):
         self.assertCountEqual(self.graph.vertices(), self.vertices)
 
@@ -72,6 +81,19 @@ class TestCase(unittest.TestCase):
 
         self.assertCountEqual(self.graph.edges(), edges)
 
+    def test_edges_list(self):
+        edges = []
+        for source, destination, weight in self.edges:
+            pair = sorted([source, destination])
+            edges.append((pair[0], pair[1], weight))
+
+        self.assertCountEqual(self.graph.edges_list(), edges)
+        self.assertEqual(len(self.graph.edges_list()), self.graph.edge_count())
+        self.assertIs(self.graph.edges_list(), self.graph.edges_list())
+
+        self.graph.remove_edge('B', 'A')
+        self.assertEqual(len(self.graph.edges_list()), self.graph.edge_count())
+
     def test_incident_edges(self):
         vertex = 'A'
         edges = []
@@ -83,6 +105,18 @@ class TestCase(unittest.TestCase):
         self.assertCountEqual(self.graph.incident_edges(vertex, edge_type='outgoing'), edges)
         self.assertCountEqual(self.graph.incident_edges(vertex, edge_type='incoming'), edges)
 
+    def test_incident_edges_list(self):
+        vertex = 'B'
+        edges = []
+        for source, destination, weight in self.edges:
+            if vertex in (source, destination):
+                pair = sorted([source, destination])
+                edges.append((pair[0], pair[1], weight))
+
+        self.assertCountEqual(self.graph.incident_edges_list(vertex, edge_type='outgoing'), edges)
+        self.assertCountEqual(self.graph.incident_edges_list(vertex, edge_type='incoming'), edges)
+        self.assertEqual(self.graph.incident_edges_list('NOT EXIST'), ())
+
     def test_edge_weight(self):
         for source, destination, weight in self.edges:
             self.assertEqual(self.graph.edge_weight(source, destination), weight)
@@ -106,6 +140,15 @@ class TestCase(unittest.TestCase):
         visited = self.graph.breadth_first_search(v)
         self.assertCountEqual(visited, ['A', 'B', 'C', 'D', 'E', 'F', 'G'])
 
+    def test_find_shortest_path_dijkstra(self):
+        # A negative undirected edge is a negative weight cycle of 2 edges,
+        # which doesn't make the search loop forever.
+        graph = UndirectedGraph()
+        graph.add_edge('A', 'B', -1)
+        graph.add_edge('B', 'C', 1)
+        path = graph.find_shortest_path_dijkstra('A', 'C')
+        self.assertEqual(path, ['A', 'B', 'C'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+# coding: utf-8
+"""
+d-ary Heap
+https://en.wikipedia.org/wiki/D-ary_heap
+
+A d-ary heap is a generalization of the binary heap in which each node has d children instead of 2:
+- array[0] is the root node.
+- array[floor((i - 1) / d)] is the parent node of array[i].
+- array[(i * d) + 1] ... array[(i * d) + d] are the children nodes of array[i].
+
+The tree has only log_d(n) levels, so up-heap (used by push and decrease-key) is cheaper,
+at the price of comparing up to d children on each down-heap step.
+
+We also maintain a position index {item: index of the item in the array},
+so we could locate an item in O(1) and implement decrease-key without a linear search.
+
+Applications:
+- Dijkstra's algorithm and Prim's algorithm, which could update priorities with decrease-key
+  instead of pushing duplicate entries.
+
+NOTE: In CPython, heapq with lazy deletion of stale entries is usually faster than this heap,
+since heapq is implemented in C while each swap here also updates the position index in Python.
+"""
+
+
+# This is a min heap of (key, item) pairs.
+class DAryHeap:
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError('d must be at least 2')
+
+        self.d = d
+        self._array = []  # [(key, item), ]
+        self._positions = {}  # {item: index}
+
+    def __len__(self):
+        return len(self._array)
+
+    def __iter__(self):
+        for key, item in sorted(self._array, key=lambda pair: pair[0]):
+            yield (key, item)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def _parent(self, index):
+        return (index - 1) // self.d
+
+    def _swap(self, index_a, index_b):
+        array = self._array
+        array[index_a], array[index_b] = array[index_b], array[index_a]
+        self._positions[array[index_a][1]] = index_a
+        self._positions[array[index_b][1]] = index_b
+
+    def _up_heap(self, index):
+        # Compare the current item with its parent;
+        # if they're not in the correct order, swap them.
+        array = self._array
+        while index >= 1:
+            parent_index = self._parent(index)
+            if array[parent_index][0] > array[index][0]:
+                self._swap(parent_index, index)
+            else:
+                return
+            index = parent_index
+
+    def _min_child_index(self, index):
+        first_child_index = (index * self.d) + 1
+        if first_child_index >= len(self._array):
+            return None  # There's no child.
+
+        last_child_index = min(first_child_index + self.d, len(self._array))
+        min_child_index = first_child_index
+        for child_index in range(first_child_index + 1, last_child_index):
+            if self._array[child_index][0] < self._array[min_child_index][0]:
+                min_child_index = child_index
+
+        return min_child_index
+
+    def _down_heap(self, index):
+        # Compare the current item with its smallest child;
+        # if they're not in the correct order, swap with its smallest child.
+        array = self._array
+        while True:
+            min_child_index = self._min_child_index(index)
+            if min_child_index is None or array[index][0] <= array[min_child_index][0]:
+                return
+            self._swap(index, min_child_index)
+            index = min_child_index
+
+    # O(log_d n)
+    def push(self, key, item):
+        if item in self._positions:
+            raise ValueError(f'{item} is already in the heap')
+
+        self._array.append((key, item))
+        self._positions[item] = len(self._array) - 1
+        self._up_heap(len(self._array) - 1)
+
+    # O(d * log_d n)
+    def pop_min(self):
+        if not self._array:
+            raise ValueError('heap is empty')
+
+        # Replace the root with the last element on the last level, and drop the old root.
+        self._swap(0, len(self._array) - 1)
+        key, item = self._array.pop()
+        del self._positions[item]
+        if self._array:
+            self._down_heap(0)
+
+        return (key, item)
+
+    # O(1) if the new key is not greater than the minimum key
+    # O(d * log_d n) otherwise
+    def push_pop(self, key, item):
+        # The same as push() followed by pop_min(), but with at most one down-heap.
+        if item in self._positions:
+            raise ValueError(f'{item} is already in the heap')
+
+        if not self._array or key <= self._array[0][0]:
+            return (key, item)
+
+        popped = self._array[0]
+        del self._positions[popped[1]]
+        self._array[0] = (key, item)
+        self._positions[item] = 0
+        self._down_heap(0)
+
+        return popped
+
+    # O(1)
+    def peek_min(self):
+        try:
+            return self._array[0]
+        except IndexError:
+            raise ValueError('heap is empty')
+
+    # O(log_d n)
+    def decrease_key(self, item, key):
+        try:
+            index = self._positions[item]
+        except KeyError:
+            raise ValueError(f'{item} is not in the heap')
+
+        if key > self._array[index][0]:
+            raise ValueError(f'New key {key} is greater than the current key')
+
+        self._array[index] = (key, item)
+        self._up_heap(index)
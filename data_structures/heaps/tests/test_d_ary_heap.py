@@ -0,0 +1,103 @@
+# coding: utf-8
+import heapq
+import random
+import unittest
+
+from data_structures.heaps.d_ary_heap import DAryHeap
+
+
+class TestCase(unittest.TestCase):
+    def setUp(self):
+        self.empty_heap = DAryHeap()
+        self.heap = DAryHeap(d=4)
+        self.heapq_heap = []
+
+        self.keys = [random.randint(-100, 100) for _ in range(random.randint(1, 100))]
+        for item, key in enumerate(self.keys):
+            self.heap.push(key, item)
+            heapq.heappush(self.heapq_heap, (key, item))
+
+    def test__init__(self):
+        with self.assertRaises(ValueError):
+            DAryHeap(d=1)
+
+    def test__len__(self):
+        self.assertEqual(len(self.empty_heap), 0)
+        self.assertEqual(len(self.heap), len(self.keys))
+
+    def test__iter__(self):
+        self.assertEqual(list(self.empty_heap), [])
+        self.assertEqual([key for key, _ in self.heap], sorted(self.keys))
+
+    def test__contains__(self):
+        self.assertIn(0, self.heap)
+        self.assertNotIn('NOT EXIST', self.heap)
+
+    def test_push(self):
+        self.empty_heap.push(42, 'A')
+        self.assertEqual(len(self.empty_heap), 1)
+        self.assertEqual(self.empty_heap.pop_min(), (42, 'A'))
+        self.assertEqual(len(self.empty_heap), 0)
+
+        with self.assertRaises(ValueError):
+            self.heap.push(42, 0)
+
+    def test_pop_min(self):
+        for _ in range(len(self.keys)):
+            key, item = self.heap.pop_min()
+            self.assertEqual(key, heapq.heappop(self.heapq_heap)[0])
+            self.assertNotIn(item, self.heap)
+
+        self.assertEqual(len(self.heap), 0)
+
+        with self.assertRaises(ValueError):
+            self.heap.pop_min()
+
+    def test_push_pop(self):
+        self.assertEqual(self.empty_heap.push_pop(42, 'A'), (42, 'A'))
+        self.assertEqual(len(self.empty_heap), 0)
+
+        min_key = self.heapq_heap[0][0]
+        self.assertEqual(self.heap.push_pop(min_key - 1, 'A'), (min_key - 1, 'A'))
+        self.assertNotIn('A', self.heap)
+
+        self.assertEqual(self.heap.push_pop(101, 'B')[0], min_key)
+        self.assertIn('B', self.heap)
+        self.assertEqual(len(self.heap), len(self.keys))
+
+        keys = sorted(self.keys)[1:] + [101, ]
+        for key in keys:
+            self.assertEqual(self.heap.pop_min()[0], key)
+
+        with self.assertRaises(ValueError):
+            self.empty_heap.push(0, 'A')
+            self.empty_heap.push_pop(0, 'A')
+
+    def test_peek_min(self):
+        with self.assertRaises(ValueError):
+            self.empty_heap.peek_min()
+
+        self.assertEqual(self.heap.peek_min()[0], self.heapq_heap[0][0])
+
+    def test_decrease_key(self):
+        new_keys = list(self.keys)
+        for item in random.sample(range(len(self.keys)), len(self.keys) // 2):
+            new_keys[item] -= random.randint(0, 100)
+            self.heap.decrease_key(item, new_keys[item])
+
+        for _ in range(len(new_keys)):
+            key, item = self.heap.pop_min()
+            self.assertEqual(key, new_keys[item])
+            self.assertEqual(key, min(new_keys))
+            new_keys[item] = float('inf')
+
+        with self.assertRaises(ValueError):
+            self.empty_heap.decrease_key('NOT EXIST', 0)
+
+        self.empty_heap.push(0, 'A')
+        with self.assertRaises(ValueError):
+            self.empty_heap.decrease_key('A', 1)
+
+
+if __name__ == '__main__':
+    unittest.main()